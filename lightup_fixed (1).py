@@ -9,7 +9,14 @@ bl_info = {
 }
 
 import bpy
-from mathutils import Vector
+import importlib.machinery
+import importlib.util
+import math
+import os
+import traceback
+import numpy as np
+from functools import lru_cache
+from mathutils import Matrix, Vector
 from bpy.props import (
     BoolProperty,
     FloatProperty,
@@ -23,24 +30,117 @@ from bpy.types import (
     PropertyGroup,
 )
 
+# Optional JIT compilation of the light placement kernel
+try:
+    import numba
+except ImportError:
+    numba = None
+
+# Lighting Setups
+# Each row is (name, light type, energy multiplier, size multiplier, offset),
+# where offset holds the (right, up, forward) camera-space coefficients that
+# get scaled by the light distance.
+SETUPS = {
+    'THREE_POINT': (
+        ("Key_Light", 'AREA', 1.0, 0.2, (0.866, 0.5, -0.5)),
+        ("Fill_Light", 'AREA', 0.5, 0.3, (-0.866, 0.3, -0.5)),
+        ("Back_Light", 'AREA', 0.75, 0.2, (0.0, 0.8, 0.7)),
+    ),
+    'TWO_POINT_FILL': (
+        ("Key_Light", 'AREA', 1.0, 0.2, (0.866, 0.5, -0.5)),
+        ("Fill_Light", 'AREA', 0.4, 0.3, (-0.866, 0.3, -0.5)),
+    ),
+    'TWO_POINT_BACK': (
+        ("Key_Light", 'AREA', 1.0, 0.2, (0.866, 0.5, -0.5)),
+        ("Back_Light", 'AREA', 0.6, 0.2, (0.0, 0.8, 0.7)),
+    ),
+    'SINGLE_POINT_STANDARD': (
+        ("Main_Light", 'AREA', 1.2, 0.3, (0.866, 0.5, -0.5)),
+    ),
+    'SINGLE_POINT_DRAMATIC': (
+        ("Main_Light", 'AREA', 1.2, 0.3, (0.966, 0.7, -0.3)),
+    ),
+    'SINGLE_POINT_OVERHEAD': (
+        ("Main_Light", 'AREA', 1.2, 0.3, (0.0, 1.2, 0.0)),
+    ),
+    'PRODUCT': (
+        ("Top_Light", 'AREA', 0.8, 0.5, (0.0, 1.0, -0.2)),
+        ("Front_Light", 'AREA', 0.5, 0.6, (0.0, 0.0, -1.0)),
+        ("Right_Light", 'AREA', 0.4, 0.4, (1.0, 0.0, 0.0)),
+        ("Left_Light", 'AREA', 0.3, 0.4, (-1.0, 0.0, 0.0)),
+    ),
+    'CINEMATIC': (
+        ("Key_Light", 'AREA', 1.2, 0.4, (0.966, 0.8, -0.3)),
+        ("Fill_Light", 'AREA', 0.15, 0.6, (-0.8, 0.0, -0.5)),
+        ("Rim_Light", 'AREA', 0.9, 0.25, (-0.3, 0.5, 0.8)),
+    ),
+    'APPLE_STYLE': (
+        ("Main_Light", 'AREA', 0.6, 0.4, (0.5, 0.5, -0.7)),
+        ("Edge_Light_1", 'AREA', 1.5, 0.1, (0.5, 0.2, 0.2)),
+        ("Edge_Light_2", 'AREA', 1.5, 0.1, (-0.5, 0.2, 0.2)),
+        ("Fill_Light", 'AREA', 0.3, 0.7, (0.0, 0.0, -1.0)),
+        ("Back_Light", 'AREA', 0.4, 0.2, (0.0, 0.0, 0.8)),
+    ),
+}
+
+# Offsets of every setup as read-only float32 (N, 3) arrays, built once at import
+SETUP_COEFFS = {}
+for _key, _rows in SETUPS.items():
+    SETUP_COEFFS[_key] = np.array([row[4] for row in _rows], dtype=np.float32)
+    SETUP_COEFFS[_key].flags.writeable = False
+del _key, _rows
+
+def get_setup_key(props):
+    """Get the SETUPS key for the selected setup type and its mode"""
+    if props.setup_type == 'TWO_POINT':
+        return f"TWO_POINT_{props.two_point_mode}"
+    if props.setup_type == 'SINGLE_POINT':
+        return f"SINGLE_POINT_{props.single_point_mode}"
+    return props.setup_type
+
 # Helper Functions
 def get_object_dimensions(obj):
     """Get the dimensions of an object including all its children"""
     if obj is None or obj.name not in bpy.data.objects:
         return Vector((1, 1, 1))
     
-    bbox_corners = [obj.matrix_world @ Vector(corner) for corner in obj.bound_box]
-    return Vector((
-        max(c.x for c in bbox_corners) - min(c.x for c in bbox_corners),
-        max(c.y for c in bbox_corners) - min(c.y for c in bbox_corners),
-        max(c.z for c in bbox_corners) - min(c.z for c in bbox_corners)
-    ))
+    # Transform all 8 bound box corners in one homogeneous matmul
+    matrix = np.array(obj.matrix_world, dtype=np.float32)
+    corners = np.empty((8, 4), dtype=np.float32)
+    corners[:, :3] = obj.bound_box
+    corners[:, 3] = 1.0
+    world = corners @ matrix.T
+    return Vector(np.ptp(world[:, :3], axis=0).tolist())
+
+# Last computed dimensions per object name, keyed on its world matrix and data block
+_DIM_CACHE = {}
+
+def _dimensions_cached(obj):
+    """Get object dimensions, reusing the last result while the object is unmoved"""
+    if obj is None or obj.name not in bpy.data.objects:
+        return Vector((1, 1, 1))
+
+    # Without the invalidation handler geometry edits would go unnoticed
+    if dimension_cache_handler not in bpy.app.handlers.depsgraph_update_post:
+        return get_object_dimensions(obj)
+
+    key = (
+        getattr(obj.data, "session_uid", None),
+        tuple(value for row in obj.matrix_world for value in row),
+    )
+    cached = _DIM_CACHE.get(obj.name)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    dims = get_object_dimensions(obj).freeze()
+    _DIM_CACHE[obj.name] = (key, dims)
+    return dims
 
 def calculate_light_distance(obj, factor=1.5):
     """Calculate light distance based on object dimensions"""
     if obj is None or obj.name not in bpy.data.objects:
         return 5.0
-    return max(get_object_dimensions(obj)) * factor
+    return max(_dimensions_cached(obj)) * factor
 
 def calculate_light_energy(distance, base_energy=100.0, falloff_factor=1.0):
     """Calculate light energy using modified inverse square law"""
@@ -50,14 +150,18 @@ def setup_false_color(enable=True):
     """Toggle false color view transform with state management"""
     scene = bpy.context.scene
     if enable:
-        if "prev_view_settings" not in scene:
-            scene["prev_view_settings"] = {
-                "view_transform": scene.view_settings.view_transform,
-                "look": scene.view_settings.look
-            }
+        if "_sl_prev_vt" not in scene:
+            scene["_sl_prev_vt"] = scene.view_settings.view_transform
+            scene["_sl_prev_look"] = scene.view_settings.look
         scene.view_settings.view_transform = 'False Color'
     else:
-        if "prev_view_settings" in scene:
+        if "_sl_prev_vt" in scene:
+            scene.view_settings.view_transform = scene["_sl_prev_vt"]
+            scene.view_settings.look = scene["_sl_prev_look"]
+            del scene["_sl_prev_vt"]
+            del scene["_sl_prev_look"]
+        elif "prev_view_settings" in scene:
+            # State saved by older versions as a dict property
             scene.view_settings.view_transform = scene["prev_view_settings"]["view_transform"]
             scene.view_settings.look = scene["prev_view_settings"]["look"]
             del scene["prev_view_settings"]
@@ -70,7 +174,10 @@ def get_camera_direction():
             cam.matrix_world.translation,
             -cam.matrix_world.to_quaternion() @ Vector((0, 0, 1))
         )
-    for area in bpy.context.screen.areas:
+    # Timers run without a screen in context, so fall back to the window screens
+    screen = bpy.context.screen
+    screens = [screen] if screen else [w.screen for w in bpy.context.window_manager.windows]
+    for area in (area for scr in screens for area in scr.areas):
         if area.type == 'VIEW_3D':
             space = next((s for s in area.spaces if s.type == 'VIEW_3D'), None)
             if space:
@@ -81,20 +188,249 @@ def get_camera_direction():
                 )
     return (Vector((0, 0, 5)), Vector((0, 0, -1)))
 
+# Last camera direction and the basis built from it
+_BASIS_CACHE = [None, None]
+
+def _camera_basis(cam_dir):
+    """Get the camera right, up and forward axes and the (right, forward, up) rotation"""
+    key = tuple(cam_dir)
+    if _BASIS_CACHE[0] == key:
+        return _BASIS_CACHE[1]
+
+    # get_camera_direction rotates a unit axis, so cam_dir is unit length already
+    cam_fwd = cam_dir.copy()
+    if abs(cam_fwd.z) > 0.99:
+        cam_up = Vector((1, 0, 0)).cross(cam_fwd).normalized()
+        cam_right = cam_fwd.cross(cam_up)
+    else:
+        cam_right = cam_fwd.cross(Vector((0, 0, 1))).normalized()
+        cam_up = cam_right.cross(cam_fwd)
+    basis = Matrix((cam_right, cam_fwd, cam_up)).transposed()
+
+    result = (cam_right.freeze(), cam_up.freeze(), cam_fwd.freeze(), basis.freeze())
+    _BASIS_CACHE[0] = key
+    _BASIS_CACHE[1] = result
+    return result
+
+@lru_cache(maxsize=None)
+def _local_track_matrix(coeffs):
+    """Rotation aiming a light at coeffs (right, up, forward) back at the origin,
+    expressed in the (right, forward, up) camera frame"""
+    right, up, fwd = coeffs
+    return (-Vector((right, fwd, up))).to_track_quat('-Z', 'Y').to_matrix().freeze()
+
+# Camera-space track rotations of every setup as (N, 3, 3) arrays, built once at import
+SETUP_TRACKS = {}
+for _key, _rows in SETUPS.items():
+    SETUP_TRACKS[_key] = np.array([_local_track_matrix(row[4]) for row in _rows], dtype=np.float32)
+    SETUP_TRACKS[_key].flags.writeable = False
+del _key, _rows
+
+# Light rotations for the last camera basis, keyed on offset coefficients
+_ROTATION_CACHE = {"basis": None, "eulers": {}}
+
+def light_rotation(basis, coeffs):
+    """Get the world rotation of a light at camera-relative coeffs facing the object"""
+    cache = _ROTATION_CACHE
+    if cache["basis"] != basis:
+        cache["basis"] = basis.copy()
+        cache["eulers"] = {}
+    euler = cache["eulers"].get(coeffs)
+    if euler is None:
+        euler = (basis @ _local_track_matrix(coeffs)).to_euler()
+        cache["eulers"][coeffs] = euler
+    return euler
+
+def _place_lights_py(center, basis, coeffs, dist, out_pos, out_eul):
+    """Place lights at camera-space coeffs around center and aim them back at it.
+
+    basis rows are the camera right, up and forward axes. Written with scalar
+    math only so numba can compile it.
+    """
+    for i in range(coeffs.shape[0]):
+        # World offset from the object
+        ox = (coeffs[i, 0] * basis[0, 0] + coeffs[i, 1] * basis[1, 0] + coeffs[i, 2] * basis[2, 0]) * dist
+        oy = (coeffs[i, 0] * basis[0, 1] + coeffs[i, 1] * basis[1, 1] + coeffs[i, 2] * basis[2, 1]) * dist
+        oz = (coeffs[i, 0] * basis[0, 2] + coeffs[i, 1] * basis[1, 2] + coeffs[i, 2] * basis[2, 2]) * dist
+        out_pos[i, 0] = center[0] + ox
+        out_pos[i, 1] = center[1] + oy
+        out_pos[i, 2] = center[2] + oz
+
+        length = math.sqrt(ox * ox + oy * oy + oz * oz)
+        if length == 0.0:
+            out_eul[i, 0] = 0.0
+            out_eul[i, 1] = 0.0
+            out_eul[i, 2] = 0.0
+            continue
+
+        # Local Z points away from the object so -Z tracks it
+        zx = ox / length
+        zy = oy / length
+        zz = oz / length
+
+        # Local Y is the camera up made orthogonal to Z, or forward when they align
+        d = basis[1, 0] * zx + basis[1, 1] * zy + basis[1, 2] * zz
+        yx = basis[1, 0] - d * zx
+        yy = basis[1, 1] - d * zy
+        yz = basis[1, 2] - d * zz
+        ylen = math.sqrt(yx * yx + yy * yy + yz * yz)
+        if ylen < 1e-6:
+            d = basis[2, 0] * zx + basis[2, 1] * zy + basis[2, 2] * zz
+            yx = basis[2, 0] - d * zx
+            yy = basis[2, 1] - d * zy
+            yz = basis[2, 2] - d * zz
+            ylen = math.sqrt(yx * yx + yy * yy + yz * yz)
+        yx /= ylen
+        yy /= ylen
+        yz /= ylen
+
+        xx = yy * zz - yz * zy
+        xy = yz * zx - yx * zz
+        xz = yx * zy - yy * zx
+
+        # Matrix to XYZ Euler, picking the same solution as mathutils
+        cy = math.hypot(xx, xy)
+        if cy > 16.0 * 1.1920929e-07:
+            ex = math.atan2(yz, zz)
+            ey = math.atan2(-xz, cy)
+            ez = math.atan2(xy, xx)
+            alt_x = math.atan2(-yz, -zz)
+            alt_y = math.atan2(-xz, -cy)
+            alt_z = math.atan2(-xy, -xx)
+            if abs(alt_x) + abs(alt_y) + abs(alt_z) < abs(ex) + abs(ey) + abs(ez):
+                ex = alt_x
+                ey = alt_y
+                ez = alt_z
+        else:
+            ex = math.atan2(-zy, yy)
+            ey = math.atan2(-xz, cy)
+            ez = 0.0
+        out_eul[i, 0] = ex
+        out_eul[i, 1] = ey
+        out_eul[i, 2] = ez
+
+# Bump whenever _place_lights_py changes. The version is part of the module name
+# because Python never reloads an extension module it has already loaded
+KERNEL_VERSION = 1
+
+# Ahead-of-time compiled kernel module, written next to this file by compile_kernels()
+KERNEL_MODULE = f"sl_kernels_v{KERNEL_VERSION}"
+KERNEL_SIGNATURE = 'void(f4[:], f4[:,:], f4[:,:], f4, f4[:,:], f4[:,:])'
+
+def _load_aot_kernel():
+    """Load place_lights from a compiled kernel module next to the add-on, if any"""
+    directory = os.path.dirname(os.path.abspath(__file__))
+    for suffix in importlib.machinery.EXTENSION_SUFFIXES:
+        path = os.path.join(directory, KERNEL_MODULE + suffix)
+        if not os.path.exists(path):
+            continue
+        # Built for another Python or platform: fall back, never fail the import
+        try:
+            spec = importlib.util.spec_from_file_location(KERNEL_MODULE, path)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            return module.place_lights
+        except Exception:
+            print(f"Smart Lighting: could not load {path}")
+            traceback.print_exc()
+            return None
+    return None
+
+def load_place_lights():
+    """Get the fastest available light placement kernel, or None for the mathutils path"""
+    kernel = _load_aot_kernel()
+    if kernel is not None:
+        return kernel
+    if numba is not None:
+        return numba.njit(cache=True, fastmath=True)(_place_lights_py)
+    return None
+
+def compile_kernels(output_dir):
+    """Compile the light placement kernel ahead of time with numba.pycc"""
+    from numba.pycc import CC
+    cc = CC(KERNEL_MODULE)
+    cc.output_dir = output_dir
+    cc.export('place_lights', KERNEL_SIGNATURE)(_place_lights_py)
+    cc.compile()
+
+_place_lights = load_place_lights()
+
+@lru_cache(maxsize=64)
+def _coeff_array(coeffs):
+    """Get a tuple of offset triples as a float32 (N, 3) array"""
+    # Left writeable: the AOT kernel signature only accepts mutable arrays
+    return np.array(coeffs, dtype=np.float32).reshape(-1, 3)
+
+def rename_legacy_collection():
+    """Give a suffixed lighting collection from older files its exact name"""
+    if "Smart_Lighting_Setup" in bpy.data.collections:
+        return
+    legacy = next((c for c in bpy.data.collections if "Smart_Lighting_Setup" in c.name), None)
+    if legacy:
+        legacy.name = "Smart_Lighting_Setup"
+
+# Contact shadow properties each light subclass supports in the running Blender
+_LIGHT_CAPS = {}
+
+def _light_caps(light):
+    """Get (use_contact_shadow, contact_shadow_distance, contact_shadow_thickness) support"""
+    # These live on AreaLight, PointLight etc., not on the Light base type
+    light_type = type(light)
+    caps = _LIGHT_CAPS.get(light_type)
+    if caps is None:
+        properties = light_type.bl_rna.properties
+        caps = tuple(name in properties for name in (
+            'use_contact_shadow', 'contact_shadow_distance', 'contact_shadow_thickness'))
+        _LIGHT_CAPS[light_type] = caps
+    return caps
+
+def _float_changed(current, value):
+    return not math.isclose(current, value, rel_tol=1e-6, abs_tol=1e-9)
+
 def apply_light_settings(light, props, distance):
     """Apply common light settings with Blender 4.5 compatibility"""
-    light.color = props.light_color
-    light.shadow_soft_size = props.shadow_softness * distance * 0.1
+    # Only write values that differ, every RNA write tags the depsgraph
+    color = tuple(props.light_color)
+    if tuple(light.color) != color:
+        light.color = color
+    soft = props.shadow_softness * distance * 0.1
+    if _float_changed(light.shadow_soft_size, soft):
+        light.shadow_soft_size = soft
     
     # Blender 4.5 compatible contact shadow settings
-    if hasattr(light, 'use_contact_shadow'):
-        light.use_contact_shadow = props.use_contact_shadows
+    has_contact, has_distance, has_thickness = _light_caps(light)
+    if has_contact:
+        if light.use_contact_shadow != props.use_contact_shadows:
+            light.use_contact_shadow = props.use_contact_shadows
         if props.use_contact_shadows:
-            if hasattr(light, 'contact_shadow_distance'):
+            if has_distance and _float_changed(light.contact_shadow_distance, distance * 0.1):
                 light.contact_shadow_distance = distance * 0.1
-            if hasattr(light, 'contact_shadow_thickness'):
+            if has_thickness and _float_changed(light.contact_shadow_thickness, distance * 0.02):
                 light.contact_shadow_thickness = distance * 0.02
 
+def set_camera_follow(enabled):
+    """Attach or detach the camera follow handlers and timer"""
+    handlers = bpy.app.handlers.depsgraph_update_post
+    if enabled:
+        if dimension_cache_handler not in handlers:
+            # Entries from before the last detach missed any edits made since
+            _DIM_CACHE.clear()
+            handlers.append(dimension_cache_handler)
+        if camera_update_handler not in handlers:
+            handlers.append(camera_update_handler)
+        if not bpy.app.timers.is_registered(camera_follow_timer):
+            bpy.app.timers.register(camera_follow_timer, first_interval=FOLLOW_INTERVAL, persistent=True)
+    else:
+        if camera_update_handler in handlers:
+            handlers.remove(camera_update_handler)
+        if dimension_cache_handler in handlers:
+            handlers.remove(dimension_cache_handler)
+        if bpy.app.timers.is_registered(camera_follow_timer):
+            bpy.app.timers.unregister(camera_follow_timer)
+
+def _on_camera_follow_toggle(self, context):
+    set_camera_follow(self.camera_follow)
+
 # Property Group
 class SmartLightingProperties(PropertyGroup):
     setup_type: EnumProperty(
@@ -186,7 +522,8 @@ class SmartLightingProperties(PropertyGroup):
     
     camera_follow: BoolProperty(
         name="Camera Follow",
-        default=True
+        default=True,
+        update=_on_camera_follow_toggle
     )
     
     individual_light_control: BoolProperty(
@@ -220,212 +557,56 @@ class LIGHTING_OT_create_setup(Operator):
         if not light_collection.users:
             bpy.context.scene.collection.children.link(light_collection)
 
-        # Clear existing lights
-        for ob in light_collection.objects:
-            bpy.data.objects.remove(ob, do_unlink=True)
+        setup_key = get_setup_key(props)
+        rows = SETUPS[setup_key]
+
+        # Reuse the existing lights when they already match the setup's rows,
+        # otherwise clear them and create fresh ones
+        existing = {ob.name: ob for ob in light_collection.objects}
+        reuse = sorted(existing) == sorted(row[0] for row in rows) and all(
+            existing[row[0]].type == 'LIGHT' and existing[row[0]].data.type == row[1]
+            for row in rows
+        )
+        if not reuse:
+            for ob in existing.values():
+                bpy.data.objects.remove(ob, do_unlink=True)
 
         # Get camera orientation
         cam_pos, cam_dir = get_camera_direction()
-        cam_fwd = cam_dir.normalized()
-        world_up = Vector((0, 0, 1))
-        cam_right = cam_fwd.cross(world_up).normalized() if abs(cam_fwd.dot(world_up)) < 0.99 else Vector((1, 0, 0))
-        cam_up = cam_right.cross(cam_fwd).normalized()
+        cam_right, cam_up, cam_fwd, basis = _camera_basis(cam_dir)
         obj_center = obj.matrix_world.translation
 
-        # Full Three-Point Lighting Implementation
-        if props.setup_type == 'THREE_POINT':
-            # Key Light
-            key_light = bpy.data.lights.new(name="Key_Light", type='AREA')
-            key_light.energy = energy
-            key_light.size = distance * 0.2
-            key_light_obj = bpy.data.objects.new(name="Key_Light", object_data=key_light)
-            key_light_obj.location = obj_center + cam_right * distance * 0.866 + cam_up * distance * 0.5 - cam_fwd * distance * 0.5
-            direction = obj_center - key_light_obj.location
-            key_light_obj.rotation_euler = direction.to_track_quat('-Z', 'Y').to_euler()
-            light_collection.objects.link(key_light_obj)
-
-            # Fill Light
-            fill_light = bpy.data.lights.new(name="Fill_Light", type='AREA')
-            fill_light.energy = energy * 0.5
-            fill_light.size = distance * 0.3
-            fill_light_obj = bpy.data.objects.new(name="Fill_Light", object_data=fill_light)
-            fill_light_obj.location = obj_center - cam_right * distance * 0.866 + cam_up * distance * 0.3 - cam_fwd * distance * 0.5
-            direction = obj_center - fill_light_obj.location
-            fill_light_obj.rotation_euler = direction.to_track_quat('-Z', 'Y').to_euler()
-            light_collection.objects.link(fill_light_obj)
-
-            # Back Light
-            back_light = bpy.data.lights.new(name="Back_Light", type='AREA')
-            back_light.energy = energy * 0.75
-            back_light.size = distance * 0.2
-            back_light_obj = bpy.data.objects.new(name="Back_Light", object_data=back_light)
-            back_light_obj.location = obj_center + cam_fwd * distance * 0.7 + cam_up * distance * 0.8
-            direction = obj_center - back_light_obj.location
-            back_light_obj.rotation_euler = direction.to_track_quat('-Z', 'Y').to_euler()
-            light_collection.objects.link(back_light_obj)
-
-        # Full Two-Point Lighting Implementation
-        elif props.setup_type == 'TWO_POINT':
-            # Key Light
-            key_light = bpy.data.lights.new(name="Key_Light", type='AREA')
-            key_light.energy = energy
-            key_light.size = distance * 0.2
-            key_light_obj = bpy.data.objects.new(name="Key_Light", object_data=key_light)
-            key_light_obj.location = obj_center + cam_right * distance * 0.866 + cam_up * distance * 0.5 - cam_fwd * distance * 0.5
-            direction = obj_center - key_light_obj.location
-            key_light_obj.rotation_euler = direction.to_track_quat('-Z', 'Y').to_euler()
-            light_collection.objects.link(key_light_obj)
-
-            # Secondary Light
-            if props.two_point_mode == 'FILL':
-                sec_light = bpy.data.lights.new(name="Fill_Light", type='AREA')
-                sec_light.energy = energy * 0.4
-                sec_light.size = distance * 0.3
-                sec_light_obj = bpy.data.objects.new(name="Fill_Light", object_data=sec_light)
-                sec_light_obj.location = obj_center - cam_right * distance * 0.866 + cam_up * distance * 0.3 - cam_fwd * distance * 0.5
-            else:
-                sec_light = bpy.data.lights.new(name="Back_Light", type='AREA')
-                sec_light.energy = energy * 0.6
-                sec_light.size = distance * 0.2
-                sec_light_obj = bpy.data.objects.new(name="Back_Light", object_data=sec_light)
-                sec_light_obj.location = obj_center + cam_fwd * distance * 0.7 + cam_up * distance * 0.8
-            
-            direction = obj_center - sec_light_obj.location
-            sec_light_obj.rotation_euler = direction.to_track_quat('-Z', 'Y').to_euler()
-            light_collection.objects.link(sec_light_obj)
-
-        # Full Single-Point Lighting Implementation
-        elif props.setup_type == 'SINGLE_POINT':
-            key_light = bpy.data.lights.new(name="Main_Light", type='AREA')
-            key_light.energy = energy * 1.2
-            key_light.size = distance * 0.3
-            key_light_obj = bpy.data.objects.new(name="Main_Light", object_data=key_light)
-            
-            if props.single_point_mode == 'DRAMATIC':
-                key_light_obj.location = obj_center + cam_right * distance * 0.966 + cam_up * distance * 0.7 - cam_fwd * distance * 0.3
-            elif props.single_point_mode == 'OVERHEAD':
-                key_light_obj.location = obj_center + cam_up * distance * 1.2
+        # All light positions in one matmul: center + distance * offsets @ basis
+        coeff_array = SETUP_COEFFS[setup_key]
+        basis_rows = np.array((cam_right, cam_up, cam_fwd), dtype=np.float32)
+        positions = np.array(obj_center, dtype=np.float32) + (coeff_array * distance) @ basis_rows
+
+        # All light rotations as one stacked matmul of the precomputed track rotations
+        rotations = np.array(basis, dtype=np.float32) @ SETUP_TRACKS[setup_key]
+
+        # Build the lights from the setup table
+        lights_new = bpy.data.lights.new
+        objects_new = bpy.data.objects.new
+        link = light_collection.objects.link
+        for (name, light_type, energy_mult, size_mult, coeffs), position, rotation in zip(
+                rows, positions.tolist(), rotations.tolist()):
+            if reuse:
+                light_obj = existing[name]
+                light = light_obj.data
             else:
-                key_light_obj.location = obj_center + cam_right * distance * 0.866 + cam_up * distance * 0.5 - cam_fwd * distance * 0.5
-            
-            direction = obj_center - key_light_obj.location
-            key_light_obj.rotation_euler = direction.to_track_quat('-Z', 'Y').to_euler()
-            light_collection.objects.link(key_light_obj)
-
-        # Full Product Lighting Implementation
-        elif props.setup_type == 'PRODUCT':
-            # Top Light
-            top_light = bpy.data.lights.new(name="Top_Light", type='AREA')
-            top_light.energy = energy * 0.8
-            top_light.size = distance * 0.5
-            top_light_obj = bpy.data.objects.new(name="Top_Light", object_data=top_light)
-            top_light_obj.location = obj_center + cam_up * distance * 1.0 - cam_fwd * distance * 0.2
-            direction = obj_center - top_light_obj.location
-            top_light_obj.rotation_euler = direction.to_track_quat('-Z', 'Y').to_euler()
-            light_collection.objects.link(top_light_obj)
-
-            # Front Light
-            front_light = bpy.data.lights.new(name="Front_Light", type='AREA')
-            front_light.energy = energy * 0.5
-            front_light.size = distance * 0.6
-            front_light_obj = bpy.data.objects.new(name="Front_Light", object_data=front_light)
-            front_light_obj.location = obj_center - cam_fwd * distance * 1.0
-            direction = obj_center - front_light_obj.location
-            front_light_obj.rotation_euler = direction.to_track_quat('-Z', 'Y').to_euler()
-            light_collection.objects.link(front_light_obj)
-
-            # Side Lights
-            for side in ['Right', 'Left']:
-                light = bpy.data.lights.new(name=f"{side}_Light", type='AREA')
-                light.energy = energy * (0.4 if side == 'Right' else 0.3)
-                light.size = distance * 0.4
-                light_obj = bpy.data.objects.new(name=f"{side}_Light", object_data=light)
-                light_obj.location = obj_center + (cam_right if side == 'Right' else -cam_right) * distance
-                direction = obj_center - light_obj.location
-                light_obj.rotation_euler = direction.to_track_quat('-Z', 'Y').to_euler()
-                light_collection.objects.link(light_obj)
-
-        # Full Cinematic Lighting Implementation
-        elif props.setup_type == 'CINEMATIC':
-            # Key Light
-            key_light = bpy.data.lights.new(name="Key_Light", type='AREA')
-            key_light.energy = energy * 1.2
-            key_light.size = distance * 0.4
-            key_light.color = props.light_color
-            key_light_obj = bpy.data.objects.new(name="Key_Light", object_data=key_light)
-            key_light_obj.location = obj_center + cam_right * distance * 0.966 + cam_up * distance * 0.8 - cam_fwd * distance * 0.3
-            direction = obj_center - key_light_obj.location
-            key_light_obj.rotation_euler = direction.to_track_quat('-Z', 'Y').to_euler()
-            light_collection.objects.link(key_light_obj)
-
-            # Fill Light
-            fill_light = bpy.data.lights.new(name="Fill_Light", type='AREA')
-            fill_light.energy = energy * 0.15
-            fill_light.size = distance * 0.6
-            fill_light.color = props.light_color
-            fill_light_obj = bpy.data.objects.new(name="Fill_Light", object_data=fill_light)
-            fill_light_obj.location = obj_center - cam_right * distance * 0.8 - cam_fwd * distance * 0.5
-            direction = obj_center - fill_light_obj.location
-            fill_light_obj.rotation_euler = direction.to_track_quat('-Z', 'Y').to_euler()
-            light_collection.objects.link(fill_light_obj)
-
-            # Rim Light
-            rim_light = bpy.data.lights.new(name="Rim_Light", type='AREA')
-            rim_light.energy = energy * 0.9
-            rim_light.size = distance * 0.25
-            rim_light.color = props.light_color
-            rim_light_obj = bpy.data.objects.new(name="Rim_Light", object_data=rim_light)
-            rim_light_obj.location = obj_center + cam_fwd * distance * 0.8 + cam_up * distance * 0.5 - cam_right * distance * 0.3
-            direction = obj_center - rim_light_obj.location
-            rim_light_obj.rotation_euler = direction.to_track_quat('-Z', 'Y').to_euler()
-            light_collection.objects.link(rim_light_obj)
-
-        # Full Apple-Style Lighting Implementation
-        elif props.setup_type == 'APPLE_STYLE':
-            # Main Light
-            main_light = bpy.data.lights.new(name="Main_Light", type='AREA')
-            main_light.energy = energy * 0.6
-            main_light.size = distance * 0.4
-            main_light.color = props.light_color
-            main_light_obj = bpy.data.objects.new(name="Main_Light", object_data=main_light)
-            main_light_obj.location = obj_center + cam_right * distance * 0.5 + cam_up * distance * 0.5 - cam_fwd * distance * 0.7
-            direction = obj_center - main_light_obj.location
-            main_light_obj.rotation_euler = direction.to_track_quat('-Z', 'Y').to_euler()
-            light_collection.objects.link(main_light_obj)
-
-            # Edge Lights
-            for i in [1, 2]:
-                edge_light = bpy.data.lights.new(name=f"Edge_Light_{i}", type='AREA')
-                edge_light.energy = energy * 1.5
-                edge_light.size = distance * 0.1
-                edge_light.color = (1.0, 1.0, 1.0)
-                edge_light_obj = bpy.data.objects.new(name=f"Edge_Light_{i}", object_data=edge_light)
-                if i == 1:
-                    edge_light_obj.location = obj_center + cam_right * distance * 0.5 + cam_fwd * distance * 0.2 + cam_up * distance * 0.2
-                else:
-                    edge_light_obj.location = obj_center - cam_right * distance * 0.5 + cam_fwd * distance * 0.2 + cam_up * distance * 0.2
-                direction = obj_center - edge_light_obj.location
-                edge_light_obj.rotation_euler = direction.to_track_quat('-Z', 'Y').to_euler()
-                light_collection.objects.link(edge_light_obj)
-
-            # Fill and Back Lights
-            for light_type in ['Fill', 'Back']:
-                light = bpy.data.lights.new(name=f"{light_type}_Light", type='AREA')
-                light.energy = energy * (0.3 if light_type == 'Fill' else 0.4)
-                light.size = distance * (0.7 if light_type == 'Fill' else 0.2)
-                light.color = props.light_color
-                light_obj = bpy.data.objects.new(name=f"{light_type}_Light", object_data=light)
-                if light_type == 'Fill':
-                    light_obj.location = obj_center - cam_fwd * distance * 1.0
-                else:
-                    light_obj.location = obj_center + cam_fwd * distance * 0.8
-                direction = obj_center - light_obj.location
-                light_obj.rotation_euler = direction.to_track_quat('-Z', 'Y').to_euler()
-                light_collection.objects.link(light_obj)
-
-        # Apply common settings with compatibility check
-        for light_obj in light_collection.objects:
-            apply_light_settings(light_obj.data, props, distance)
+                light = lights_new(name=name, type=light_type)
+                light_obj = objects_new(name=name, object_data=light)
+            light.energy = energy * energy_mult
+            light.size = distance * size_mult
+            apply_light_settings(light, props, distance)
+            light_obj.location = position
+            light_obj.rotation_euler = Matrix(rotation).to_euler()
+            light_obj["sl_coeffs"] = coeffs
+            if not reuse:
+                link(light_obj)
+
+        # Start following now that there are lights to move
+        set_camera_follow(props.camera_follow)
 
         # Toggle false color
         setup_false_color(props.enable_false_color)
@@ -452,7 +633,7 @@ class LIGHTING_OT_update_lights(Operator):
 
     def execute(self, context):
         props = context.scene.smart_lighting_props
-        light_collection = next((c for c in bpy.data.collections if "Smart_Lighting_Setup" in c.name), None)
+        light_collection = bpy.data.collections.get("Smart_Lighting_Setup")
         
         if not light_collection:
             self.report({'ERROR'}, "No lighting setup found")
@@ -491,6 +672,38 @@ class LIGHTING_OT_adjust_exposure(Operator):
         bpy.ops.lighting.update_lights()
         return {'FINISHED'}
     
+class LIGHTING_OT_compile_kernels(Operator):
+    """Compile the light placement kernel so camera follow starts without JIT warmup"""
+    bl_idname = "lighting.compile_kernels"
+    bl_label = "Compile Fast Kernels"
+
+    def execute(self, context):
+        global _place_lights
+        if numba is None:
+            self.report({'ERROR'}, "Numba is not installed in Blender's Python")
+            return {'CANCELLED'}
+
+        # Never rebuild a module this session already loaded, it would not be reloaded
+        kernel = _load_aot_kernel()
+        if kernel is not None:
+            _place_lights = kernel
+            self.report({'INFO'}, "Fast light kernels are already compiled")
+            return {'FINISHED'}
+
+        try:
+            compile_kernels(os.path.dirname(os.path.abspath(__file__)))
+        except Exception as exc:
+            self.report({'ERROR'}, f"Kernel compilation failed: {exc}")
+            return {'CANCELLED'}
+
+        kernel = _load_aot_kernel()
+        if kernel is None:
+            self.report({'WARNING'}, "Compiled fast light kernels, restart Blender to use them")
+            return {'FINISHED'}
+        _place_lights = kernel
+        self.report({'INFO'}, "Compiled fast light kernels")
+        return {'FINISHED'}
+
 class LIGHTING_PT_smart_lighting_panel(Panel):
     """Smart Lighting Setup Panel"""
     bl_label = "Smart Lighting Setup"
@@ -514,10 +727,12 @@ class LIGHTING_PT_smart_lighting_panel(Panel):
             box.prop(props, "single_point_mode")
         
         box.prop(props, "camera_follow", icon='HIDE_OFF')
+        if numba is not None:
+            box.operator("lighting.compile_kernels", icon='SETTINGS')
         box.operator("lighting.create_setup")
 
         # Global Properties - Original Structure Maintained
-        has_lights = any("Smart_Lighting_Setup" in c.name for c in bpy.data.collections)
+        has_lights = "Smart_Lighting_Setup" in bpy.data.collections
         if has_lights:
             box = layout.box()
             box.label(text="Global Light Properties")
@@ -560,65 +775,135 @@ class LIGHTING_PT_smart_lighting_panel(Panel):
             box.prop(props, "distance_factor")
             box.prop(props, "falloff_factor")
 
+# Camera direction, object center and light distance of the last placement
+_LAST_STATE = None
+
+# Set by the depsgraph handler, consumed by the follow timer
+_DIRTY = False
+
+# Seconds between follow timer ticks
+FOLLOW_INTERVAL = 1.0 / 30.0
+
 # Preserve Original Handler Logic with Validation Fixes
 @bpy.app.handlers.persistent
-def camera_update_handler(scene):
+def camera_update_handler(scene, depsgraph=None):
+    global _DIRTY
     if not hasattr(scene, "smart_lighting_props") or not scene.smart_lighting_props.camera_follow:
         return
     
+    # Only object transforms and scene properties can move the lights
+    if depsgraph is not None and not (depsgraph.id_type_updated('OBJECT') or depsgraph.id_type_updated('SCENE')):
+        return
+    
+    # Defer the placement to the timer so event storms cost one update per tick
+    _DIRTY = True
+
+def camera_follow_timer():
+    global _DIRTY, _LAST_STATE
+    if _DIRTY:
+        _DIRTY = False
+        scene = bpy.context.scene
+        if scene is not None and hasattr(scene, "smart_lighting_props"):
+            # A timer that raises is unregistered for good, so report and keep ticking
+            try:
+                update_follow_lights(scene)
+            except Exception:
+                print("Smart Lighting: camera follow update failed")
+                traceback.print_exc()
+                _LAST_STATE = None
+    return FOLLOW_INTERVAL
+
+def update_follow_lights(scene):
+    """Move the lighting setup to follow the camera around the active object"""
+    global _LAST_STATE, _place_lights
+    
     # Original Positioning Logic with Object Validation
-    light_collection = next((c for c in bpy.data.collections if "Smart_Lighting_Setup" in c.name), None)
+    light_collection = bpy.data.collections.get("Smart_Lighting_Setup")
     if not light_collection or not light_collection.objects:
         return
     
-    obj = bpy.context.active_object
+    obj = bpy.context.view_layer.objects.active
     if not obj or obj.name not in bpy.data.objects:
         return
     
+    props = scene.smart_lighting_props
+    
     # Keep Original Coordinate Calculations
     obj_center = obj.matrix_world.translation
     cam_pos, cam_dir = get_camera_direction()
-    cam_fwd = cam_dir.normalized()
-    world_up = Vector((0, 0, 1))
+    distance = calculate_light_distance(obj, props.distance_factor)
     
-    if abs(cam_fwd.dot(world_up)) > 0.99:
-        cam_right = Vector((1, 0, 0))
-    else:
-        cam_right = cam_fwd.cross(world_up).normalized()
+    # Skip when nothing the placement depends on has changed
+    state = (tuple(cam_dir), tuple(obj_center), distance)
+    if state == _LAST_STATE:
+        return
+    _LAST_STATE = state
     
-    cam_up = cam_right.cross(cam_fwd).normalized()
-    distance = calculate_light_distance(obj, scene.smart_lighting_props.distance_factor)
+    cam_right, cam_up, cam_fwd, basis = _camera_basis(cam_dir)
 
-    # Original Light Positioning Rules
+    lights = []
+    light_coeffs = []
     for light_obj in light_collection.objects:
         if light_obj.type != 'LIGHT':
             continue
-            
-        light_name = light_obj.name
-        new_pos = obj_center.copy()
-        
-        if "Key_Light" in light_name:
-            new_pos += cam_right * distance * 0.866 + cam_up * distance * 0.5 - cam_fwd * distance * 0.5
-        elif "Fill_Light" in light_name:
-            new_pos += -cam_right * distance * 0.866 + cam_up * distance * 0.3 - cam_fwd * distance * 0.5
-        elif "Back_Light" in light_name or "Rim_Light" in light_name:
-            new_pos += cam_fwd * distance * 0.7 + cam_up * distance * 0.8
-        elif "Top_Light" in light_name:
-            new_pos += cam_up * distance * 1.0 - cam_fwd * distance * 0.2
-        elif "Front_Light" in light_name:
-            new_pos += -cam_fwd * distance * 1.0
-        elif "Right_Light" in light_name:
-            new_pos += cam_right * distance * 1.0
-        elif "Left_Light" in light_name:
-            new_pos += -cam_right * distance * 1.0
-        elif "Main_Light" in light_name:
-            new_pos += cam_right * distance * 0.866 + cam_up * distance * 0.5 - cam_fwd * distance * 0.5
-        elif "Edge_Light" in light_name:
-            new_pos += cam_fwd * distance * 0.3 + cam_up * distance * 0.5
-            
-        light_obj.location = new_pos
-        direction = obj_center - new_pos
-        light_obj.rotation_euler = direction.to_track_quat('-Z', 'Y').to_euler()
+
+        # Offset stored on the light when the setup was created
+        coeffs = light_obj.get("sl_coeffs")
+        if coeffs is None:
+            continue
+        lights.append(light_obj)
+        light_coeffs.append(tuple(coeffs))
+
+    if _place_lights is not None:
+        # Compiled path: all positions and rotations in one call
+        try:
+            coeff_array = _coeff_array(tuple(light_coeffs))
+            out_pos = np.empty_like(coeff_array)
+            out_eul = np.empty_like(coeff_array)
+            _place_lights(
+                np.array(obj_center, dtype=np.float32),
+                np.array((cam_right, cam_up, cam_fwd), dtype=np.float32),
+                coeff_array,
+                distance,
+                out_pos,
+                out_eul,
+            )
+        except Exception:
+            # e.g. a failed JIT compile; keep following with the mathutils path
+            print("Smart Lighting: light placement kernel failed, using mathutils")
+            traceback.print_exc()
+            _place_lights = None
+        else:
+            # Plain float lists assign straight into the RNA arrays, no Vector/Euler needed
+            for light_obj, position, rotation in zip(lights, out_pos.tolist(), out_eul.tolist()):
+                light_obj.location = position
+                light_obj.rotation_euler = rotation
+            return
+
+    for light_obj, coeffs in zip(lights, light_coeffs):
+        light_obj.location = obj_center + (cam_right * coeffs[0] + cam_up * coeffs[1] + cam_fwd * coeffs[2]) * distance
+        light_obj.rotation_euler = light_rotation(basis, coeffs)
+
+@bpy.app.handlers.persistent
+def dimension_cache_handler(scene, depsgraph):
+    # Geometry edits change the bound box without touching the world matrix
+    if not (depsgraph.id_type_updated('OBJECT') or depsgraph.id_type_updated('MESH')):
+        return
+    for update in depsgraph.updates:
+        if update.is_updated_geometry:
+            _DIM_CACHE.clear()
+            return
+
+@bpy.app.handlers.persistent
+def load_post_handler(dummy):
+    rename_legacy_collection()
+    # Follow only when the file has a lighting setup to move
+    scene = bpy.context.scene
+    set_camera_follow(
+        scene is not None
+        and scene.smart_lighting_props.camera_follow
+        and "Smart_Lighting_Setup" in bpy.data.collections
+    )
 
 def register():
     # Original Registration with Handler Fix
@@ -627,22 +912,35 @@ def register():
     bpy.utils.register_class(LIGHTING_OT_toggle_false_color)
     bpy.utils.register_class(LIGHTING_OT_adjust_exposure)
     bpy.utils.register_class(LIGHTING_OT_update_lights)
+    bpy.utils.register_class(LIGHTING_OT_compile_kernels)
     bpy.utils.register_class(LIGHTING_PT_smart_lighting_panel)
     
-    # Safe Handler Registration
-    if camera_update_handler in bpy.app.handlers.depsgraph_update_post:
-        bpy.app.handlers.depsgraph_update_post.remove(camera_update_handler)
-    bpy.app.handlers.depsgraph_update_post.append(camera_update_handler)
+    # Safe Handler Registration, camera follow is attached by set_camera_follow()
+    if load_post_handler not in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.append(load_post_handler)
     
     bpy.types.Scene.smart_lighting_props = PointerProperty(type=SmartLightingProperties)
 
+    # bpy.data is restricted while add-ons load at startup; load_post covers that case
+    try:
+        load_post_handler(None)
+    except AttributeError:
+        pass
+
 def unregister():
+    global _LAST_STATE, _DIRTY
     # Original Unregistration with Handler Cleanup
-    if camera_update_handler in bpy.app.handlers.depsgraph_update_post:
-        bpy.app.handlers.depsgraph_update_post.remove(camera_update_handler)
+    set_camera_follow(False)
+    if load_post_handler in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(load_post_handler)
+    _DIM_CACHE.clear()
+    _LIGHT_CAPS.clear()
+    _LAST_STATE = None
+    _DIRTY = False
     
     del bpy.types.Scene.smart_lighting_props
     bpy.utils.unregister_class(LIGHTING_PT_smart_lighting_panel)
+    bpy.utils.unregister_class(LIGHTING_OT_compile_kernels)
     bpy.utils.unregister_class(LIGHTING_OT_update_lights)
     bpy.utils.unregister_class(LIGHTING_OT_adjust_exposure)
     bpy.utils.unregister_class(LIGHTING_OT_toggle_false_color)